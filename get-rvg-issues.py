@@ -14,29 +14,45 @@ Usage:
     python get-rvg-issues.py --output csv --save output.csv
     python get-rvg-issues.py --jql "project = RVG AND status = Active"
     python get-rvg-issues.py --issues RVG-1 RVG-2 RVG-3
+    python get-rvg-issues.py --batch-size 50
+    python get-rvg-issues.py --no-cache
     python get-rvg-issues.py --verbose
 
 Environment variables:
     JIRA_USER_EMAIL  - Your Jira account email (required)
     JIRA_API_TOKEN   - Your Jira API token (required)
     JIRA_SERVER_URL  - Jira server URL (default: https://riscv.atlassian.net)
+    JIRA_MAX_WORKERS - Concurrent linked-issue requests (default: 10)
+    JIRA_BATCH_SIZE  - Issues requested per search page (default: 100)
+    JIRA_MAX_RPS     - Maximum requests per second, 0 for no limit (default: 10)
 """
 
 from __future__ import annotations
 
 import argparse
-import csv
+import itertools
 import json
 import os
 import re
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
-
-import requests
-from requests.adapters import HTTPAdapter
-from requests.auth import HTTPBasicAuth
-from urllib3.util.retry import Retry
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, TextIO, Tuple
+
+# requests (and urllib3) are imported where a session is built, so --help and
+# the missing-credentials error do not pay for them
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson  # optional, faster JSON parsing/encoding
+except ImportError:
+    orjson = None
 
 # =========================
 # Config / Constants
@@ -46,6 +62,29 @@ JIRA_SERVER_URL = os.getenv("JIRA_SERVER_URL", "https://riscv.atlassian.net")
 JIRA_USER_EMAIL = os.getenv("JIRA_USER_EMAIL")
 JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
 HTTP_TIMEOUT_SECS = int(os.getenv("JIRA_HTTP_TIMEOUT", "30"))
+SEARCH_PAGE_SIZE = max(int(os.getenv("JIRA_BATCH_SIZE", "100")), 1)
+
+# On-disk cache of fetched issues, reused across runs while fresh
+CACHE_DIR = os.path.expanduser("~/.cache/rvg-issues")
+ISSUE_CACHE_FILE = os.path.join(CACHE_DIR, "cache.json")
+DEFAULT_CACHE_TTL_SECS = 3600
+LINK_TYPES_CACHE_FILE = os.path.join(CACHE_DIR, "link_types.json")
+LINK_TYPES_CACHE_TTL_SECS = 86400
+
+# Maximum number of issue keys per JQL "key in (...)" search
+JQL_KEYS_PER_SEARCH = 100
+
+# Maximum number of issue keys per /issue/bulkfetch request
+BULK_FETCH_MAX_KEYS = 100
+
+# Number of linked issues fetched concurrently
+LINKED_FETCH_WORKERS = max(int(os.getenv("JIRA_MAX_WORKERS", "10")), 1)
+
+# Client-side request rate limit (requests per second, 0 disables)
+MAX_REQUESTS_PER_SEC = float(os.getenv("JIRA_MAX_RPS", "10"))
+
+# Connections kept per host by the HTTP session
+HTTP_POOL_SIZE = max(32, LINKED_FETCH_WORKERS)
 
 # Project key
 PROJECT_KEY = "RVG"
@@ -80,9 +119,14 @@ LINK_TYPES_OF_INTEREST = [
     "is direct-lined by",
     "is governed by",
 ]
+LINK_TYPES_OF_INTEREST_LC = tuple(lt.lower() for lt in LINK_TYPES_OF_INTEREST)
 
-# Fields to fetch from Jira
-ISSUE_FIELDS = [
+# Delimiters between addresses in free-text email fields
+_EMAIL_SPLIT_RE = re.compile(r"[,;\s]+")
+
+# Fields to fetch from Jira, by custom field ID. Fixed tuples built once at
+# import; issues are read with direct fields.get(CF_...) lookups
+ISSUE_FIELDS = (
     "summary",
     "status",
     "issuelinks",
@@ -106,7 +150,40 @@ ISSUE_FIELDS = [
     CF_IS_ACTING_VICE_CHAIR,
     CF_RECHARTER_APPROVAL_DATE,
     CF_PARTICIPATION_VOTING,
-]
+)
+
+# Write buffer for output files
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Columns of the flattened CSV output (--output csv)
+CSV_FIELDNAMES = (
+    "type",
+    "key",
+    "summary",
+    "url",
+    "chair",
+    "chair_email",
+    "vice_chair",
+    "vice_chair_email",
+    "emails",
+    "linked_to",
+    "link_type",
+)
+
+# Fields to fetch for linked (governing) issues: only what the text and CSV
+# outputs use. JSON output reports every IssueInfo field, so it fetches
+# linked issues with ISSUE_FIELDS instead
+LINKED_ISSUE_FIELDS = (
+    "summary",
+    CF_CHAIR,
+    CF_CHAIR_EMAIL,
+    CF_CHAIR_AFFILIATION,
+    CF_VICE_CHAIR,
+    CF_VICE_CHAIR_EMAIL,
+    CF_VICE_CHAIR_AFFILIATION,
+    CF_MAILING_LIST,
+    CF_PARTICIPATION_VOTING,
+)
 
 # =========================
 # Helpers
@@ -115,8 +192,15 @@ ISSUE_FIELDS = [
 
 def make_http_session() -> requests.Session:
     """
-    Shared session for REST calls with retries/backoff.
+    Shared session for REST calls with retries/backoff, authenticated with
+    the Jira credentials and keeping connections alive between calls.
     """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from requests.auth import HTTPBasicAuth
+    from requests.utils import DEFAULT_ACCEPT_ENCODING
+    from urllib3.util.retry import Retry
+
     s = requests.Session()
     retries = Retry(
         total=5,
@@ -125,11 +209,66 @@ def make_http_session() -> requests.Session:
         allowed_methods=["GET", "POST", "PUT"],
         raise_on_status=False,
     )
-    s.mount("https://", HTTPAdapter(max_retries=retries))
-    s.headers.update({"Accept": "application/json", "Content-Type": "application/json"})
+    # All calls go to one Jira host; keep enough pooled keep-alive
+    # connections to it for the concurrent fetches
+    adapter = HTTPAdapter(
+        max_retries=retries,
+        pool_connections=1,
+        pool_maxsize=HTTP_POOL_SIZE,
+        pool_block=False,
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.auth = HTTPBasicAuth(JIRA_USER_EMAIL, JIRA_API_TOKEN)
+    s.headers.update({
+        "Accept": "application/json",
+        # Compressed responses: gzip/deflate, plus br/zstd if their
+        # decoders are installed
+        "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+        "Content-Type": "application/json",
+        "User-Agent": "adm-tc-dashboard",
+    })
     return s
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces outgoing requests to `rate` per `per`
+    seconds, so concurrent fetches do not run into HTTP 429 responses.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0) -> None:
+        self.rate = rate / per
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, tokens: float = 1.0) -> None:
+        """Take tokens, sleeping until they are available."""
+        if self.rate <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve the tokens now; waiting callers queue up behind each other
+            self.tokens -= tokens
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+_rate_limiter = TokenBucket(rate=MAX_REQUESTS_PER_SEC)
+
+
+def _json_loads(content: bytes) -> Any:
+    """Parse a JSON response body or cache file, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 def _respect_retry_after(resp: requests.Response) -> None:
     """Handle HTTP 429 rate limiting."""
     if resp.status_code != 429:
@@ -143,13 +282,25 @@ def _respect_retry_after(resp: requests.Response) -> None:
     time.sleep(sleep_s)
 
 
-def extract_user_info(user_field: Any) -> Dict[str, Optional[str]]:
+# Shared read-only result for empty or unrecognised user fields
+_NO_USER_INFO: Mapping[str, Optional[str]] = MappingProxyType(
+    {"displayName": None, "emailAddress": None, "accountId": None}
+)
+
+
+@lru_cache(maxsize=1024)
+def _user_info_from_name(name: str) -> Mapping[str, Optional[str]]:
+    """User info for a plain-text user field (chair names recur across issues)."""
+    return MappingProxyType({"displayName": name, "emailAddress": None, "accountId": None})
+
+
+def extract_user_info(user_field: Any) -> Mapping[str, Optional[str]]:
     """
     Extract user information from a Jira user field.
-    Returns dict with displayName, emailAddress, accountId.
+    Returns read-only mapping with displayName, emailAddress, accountId.
     """
     if not user_field:
-        return {"displayName": None, "emailAddress": None, "accountId": None}
+        return _NO_USER_INFO
 
     if isinstance(user_field, dict):
         return {
@@ -160,9 +311,9 @@ def extract_user_info(user_field: Any) -> Dict[str, Optional[str]]:
 
     # If it's a string (raw value), return as displayName
     if isinstance(user_field, str):
-        return {"displayName": user_field, "emailAddress": None, "accountId": None}
+        return _user_info_from_name(user_field)
 
-    return {"displayName": None, "emailAddress": None, "accountId": None}
+    return _NO_USER_INFO
 
 
 def extract_emails(email_field: Any) -> List[str]:
@@ -174,8 +325,10 @@ def extract_emails(email_field: Any) -> List[str]:
 
     # If it's a string, split by common delimiters
     if isinstance(email_field, str):
+        if "@" not in email_field:
+            return []
         # Split by comma, semicolon, or whitespace
-        parts = re.split(r"[,;\s]+", email_field)
+        parts = _EMAIL_SPLIT_RE.split(email_field)
         return [p.strip() for p in parts if p.strip() and "@" in p]
 
     # If it's a list (multi-user field)
@@ -198,22 +351,23 @@ def get_issue_url(issue_key: str) -> str:
     return f"{JIRA_SERVER_URL}/browse/{issue_key}"
 
 
-def search_issues(
+def iter_search_issues(
     sess: requests.Session,
     jql: str,
-    fields: List[str],
+    fields: Sequence[str],
     verbose: bool = False,
-) -> List[Dict]:
+    page_size: int = SEARCH_PAGE_SIZE,
+) -> Iterator[List[Dict]]:
     """
     Search for issues using JQL with pagination (v3 API with POST).
-    Returns list of issue data.
+    Yields one page (list of issue data) at a time, so callers can process
+    a page and drop it before the next one is requested.
     """
-    auth = HTTPBasicAuth(JIRA_USER_EMAIL, JIRA_API_TOKEN)
     url = f"{JIRA_SERVER_URL}/rest/api/3/search/jql"
 
-    all_issues = []
+    fetched = 0
     next_page_token = None
-    max_results = 50
+    max_results = page_size
 
     while True:
         payload = {
@@ -231,10 +385,10 @@ def search_issues(
                 print(f"[VERBOSE] nextPageToken: {next_page_token[:20]}...")
 
         for attempt in range(6):
+            _rate_limiter.consume()
             resp = sess.post(
                 url,
-                data=json.dumps(payload),
-                auth=auth,
+                json=payload,
                 timeout=HTTP_TIMEOUT_SECS,
             )
             if resp.status_code == 429:
@@ -244,41 +398,92 @@ def search_issues(
 
         if resp.status_code != 200:
             print(f"Error searching issues: HTTP {resp.status_code}")
-            try:
-                error_data = resp.json()
-                if "errorMessages" in error_data:
-                    for msg in error_data["errorMessages"]:
-                        print(f"  {msg}")
-            except ValueError:
+            # Only Jira's JSON error bodies are worth decoding; proxy and
+            # gateway errors are HTML or plain text
+            error_data = None
+            if "json" in resp.headers.get("Content-Type", ""):
+                try:
+                    error_data = _json_loads(resp.content)
+                except ValueError:
+                    pass
+            if isinstance(error_data, dict) and "errorMessages" in error_data:
+                for msg in error_data["errorMessages"]:
+                    print(f"  {msg}")
+            else:
                 print(f"  {resp.text[:500]}")
-            return all_issues
+            return
 
-        data = resp.json()
+        data = _json_loads(resp.content)
         issues = data.get("issues", [])
-        all_issues.extend(issues)
+        fetched += len(issues)
 
-        total = data.get("total", len(all_issues))
+        # The search/jql endpoint reports no total, only whether more pages follow
         if verbose:
-            print(f"[VERBOSE] Fetched {len(all_issues)}/{total} issues")
+            print(f"[VERBOSE] Fetched {fetched} issues")
+
+        yield issues
 
         # Check for next page token
         next_page_token = data.get("nextPageToken")
-        if not next_page_token:
+        if data.get("isLast") or not next_page_token:
             break
 
-    return all_issues
+        # The server caps the page size; ask for what it actually returns
+        if 0 < len(issues) < max_results:
+            print(f"Warning: Server returned {len(issues)} issues per page "
+                  f"(requested {max_results}), reducing batch size")
+            max_results = len(issues)
+
+
+def search_issues(
+    sess: requests.Session,
+    jql: str,
+    fields: Sequence[str],
+    verbose: bool = False,
+    page_size: int = SEARCH_PAGE_SIZE,
+) -> List[Dict]:
+    """
+    Search for issues using JQL with pagination (v3 API with POST).
+    Returns list of issue data.
+    """
+    return [
+        issue
+        for page in iter_search_issues(sess, jql, fields, verbose, page_size)
+        for issue in page
+    ]
+
+
+def search_issues_by_keys(
+    sess: requests.Session,
+    issue_keys: List[str],
+    fields: Sequence[str],
+    verbose: bool = False,
+    page_size: int = SEARCH_PAGE_SIZE,
+) -> Dict[str, Dict]:
+    """
+    Fetch several issues with JQL "key in (...)" searches, in batches.
+    Returns a dict mapping upper-cased issue key to issue data; keys the
+    search did not return are simply absent.
+    """
+    found: Dict[str, Dict] = {}
+    unique_keys = list(dict.fromkeys(k.upper() for k in issue_keys))
+    for start in range(0, len(unique_keys), JQL_KEYS_PER_SEARCH):
+        batch = unique_keys[start:start + JQL_KEYS_PER_SEARCH]
+        jql = f"key in ({','.join(batch)})"
+        for issue in search_issues(sess, jql, fields, verbose, page_size):
+            found[issue.get("key", "").upper()] = issue
+    return found
 
 
 def get_issue_details(
     sess: requests.Session,
     issue_key: str,
-    fields: List[str],
+    fields: Sequence[str],
     verbose: bool = False,
 ) -> Optional[Dict]:
     """
     Fetch a single issue with specified fields.
     """
-    auth = HTTPBasicAuth(JIRA_USER_EMAIL, JIRA_API_TOKEN)
     url = f"{JIRA_SERVER_URL}/rest/api/3/issue/{issue_key}"
     params = {"fields": ",".join(fields)}
 
@@ -286,14 +491,15 @@ def get_issue_details(
         print(f"[VERBOSE] GET {url}")
 
     for attempt in range(6):
-        resp = sess.get(url, params=params, auth=auth, timeout=HTTP_TIMEOUT_SECS)
+        _rate_limiter.consume()
+        resp = sess.get(url, params=params, timeout=HTTP_TIMEOUT_SECS)
         if resp.status_code == 429:
             _respect_retry_after(resp)
             continue
         break
 
     if resp.status_code == 200:
-        return resp.json()
+        return _json_loads(resp.content)
     elif resp.status_code == 404:
         print(f"Warning: Issue {issue_key} not found")
         return None
@@ -302,32 +508,252 @@ def get_issue_details(
         return None
 
 
-def extract_url_field(field_value: Any) -> Optional[str]:
-    """Extract URL from a Jira URL field (can be string or dict with href)."""
-    if not field_value:
+def bulk_fetch_issues(
+    sess: requests.Session,
+    issue_keys: List[str],
+    fields: Sequence[str],
+    verbose: bool = False,
+) -> Dict[str, Dict]:
+    """
+    Fetch up to BULK_FETCH_MAX_KEYS issues in one request (v3 bulkfetch API).
+    Returns a dict mapping issue key to issue data; keys that could not be
+    fetched are absent.
+    """
+    url = f"{JIRA_SERVER_URL}/rest/api/3/issue/bulkfetch"
+    payload = {"issueIdsOrKeys": issue_keys, "fields": fields}
+
+    if verbose:
+        print(f"[VERBOSE] POST {url} ({len(issue_keys)} keys)")
+
+    for attempt in range(6):
+        _rate_limiter.consume()
+        resp = sess.post(
+            url,
+            json=payload,
+            timeout=HTTP_TIMEOUT_SECS,
+        )
+        if resp.status_code == 429:
+            _respect_retry_after(resp)
+            continue
+        break
+
+    if resp.status_code != 200:
+        print(f"Warning: Error bulk fetching {len(issue_keys)} issue(s): HTTP {resp.status_code}")
+        return {}
+
+    data = _json_loads(resp.content)
+    return {issue.get("key", ""): issue for issue in data.get("issues", [])}
+
+
+def load_issue_cache(ttl_secs: int) -> Dict[str, Dict]:
+    """
+    Load the on-disk issue cache, dropping entries older than ttl_secs.
+    Returns dict of issue key -> {"fetched_at", "fields", "data"}.
+    """
+    try:
+        with open(ISSUE_CACHE_FILE, "rb") as f:
+            entries = _json_loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable cache {ISSUE_CACHE_FILE}: {e}")
+        return {}
+
+    now = time.time()
+    return {
+        key: entry
+        for key, entry in entries.items()
+        if now - entry.get("fetched_at", 0) < ttl_secs
+    }
+
+
+def _write_cache_file(path: str, data: Any) -> None:
+    """
+    Write data as compact JSON to a cache file, replacing it atomically so an
+    interrupted run never leaves a truncated cache behind.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps_compact(data))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Could not write cache {path}: {e}")
+
+
+def save_issue_cache(entries: Dict[str, Dict]) -> None:
+    """Write the on-disk issue cache."""
+    _write_cache_file(ISSUE_CACHE_FILE, entries)
+
+
+def clear_cache() -> None:
+    """Delete the on-disk issue and link type caches."""
+    for path in (ISSUE_CACHE_FILE, LINK_TYPES_CACHE_FILE):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def get_link_types(
+    sess: requests.Session,
+    use_cache: bool = True,
+    verbose: bool = False,
+) -> Optional[Dict]:
+    """
+    Fetch the available issue link types. Link types rarely change, so the
+    response is cached on disk for LINK_TYPES_CACHE_TTL_SECS.
+    Returns the issueLinkType response data, or None on error.
+    """
+    if use_cache:
+        try:
+            if time.time() - os.path.getmtime(LINK_TYPES_CACHE_FILE) < LINK_TYPES_CACHE_TTL_SECS:
+                with open(LINK_TYPES_CACHE_FILE, "rb") as f:
+                    data = _json_loads(f.read())
+                if verbose:
+                    print(f"[VERBOSE] Link types loaded from {LINK_TYPES_CACHE_FILE} (cached)")
+                return data
+        except (OSError, ValueError):
+            pass
+
+    url = f"{JIRA_SERVER_URL}/rest/api/3/issueLinkType"
+    if verbose:
+        print(f"[VERBOSE] GET {url}")
+    _rate_limiter.consume()
+    resp = sess.get(url, timeout=HTTP_TIMEOUT_SECS)
+    if resp.status_code != 200:
+        print(f"Error fetching link types: HTTP {resp.status_code}")
         return None
-    if isinstance(field_value, str):
-        return field_value
-    if isinstance(field_value, dict):
-        return field_value.get("href") or field_value.get("url")
+
+    data = _json_loads(resp.content)
+    if use_cache:
+        _write_cache_file(LINK_TYPES_CACHE_FILE, data)
+    return data
+
+
+def get_cached_issue(
+    entries: Optional[Dict[str, Dict]],
+    issue_key: str,
+    fields: Sequence[str],
+) -> Optional[Dict]:
+    """Return cached issue data if it was fetched with at least these fields."""
+    if entries is None:
+        return None
+    entry = entries.get(issue_key)
+    if entry and set(entry.get("fields", ())).issuperset(fields):
+        return entry.get("data")
+    return None
+
+
+def put_cached_issue(
+    entries: Optional[Dict[str, Dict]],
+    issue_key: str,
+    fields: Sequence[str],
+    data: Dict,
+) -> None:
+    """Store issue data in the cache (no-op when caching is disabled)."""
+    if entries is None:
+        return
+    entries[issue_key] = {"fetched_at": time.time(), "fields": list(fields), "data": data}
+
+
+def _no_value(field_value: Any) -> None:
     return None
 
 
+# Field extractors keyed by the exact JSON value type; any other type
+# (None, numbers, lists) yields None
+_URL_EXTRACTORS = {
+    str: lambda v: v or None,
+    dict: lambda v: v.get("href") or v.get("url"),
+}
+
+_DROPDOWN_EXTRACTORS = {
+    str: lambda v: v or None,
+    dict: lambda v: v.get("value") or v.get("name"),
+}
+
+
+def _checkbox_from_list(val: List) -> bool:
+    if not val:
+        return False
+    first = val[0]
+    if isinstance(first, dict):
+        return first.get("value", "").lower() == "yes"
+    return str(first).lower() == "yes"
+
+
+_CHECKBOX_PARSERS = {
+    type(None): lambda v: False,
+    bool: lambda v: v,
+    list: _checkbox_from_list,
+    dict: lambda v: v.get("value", "").lower() == "yes",
+}
+
+
+def extract_url_field(field_value: Any) -> Optional[str]:
+    """Extract URL from a Jira URL field (can be string or dict with href)."""
+    return _URL_EXTRACTORS.get(type(field_value), _no_value)(field_value)
+
+
 def extract_dropdown_value(field_value: Any) -> Optional[str]:
     """Extract value from a Jira dropdown/select field."""
-    if not field_value:
-        return None
-    if isinstance(field_value, str):
-        return field_value
-    if isinstance(field_value, dict):
-        return field_value.get("value") or field_value.get("name")
-    return None
+    return _DROPDOWN_EXTRACTORS.get(type(field_value), _no_value)(field_value)
 
 
-def process_issue(issue_data: Dict) -> Dict:
+def parse_checkbox(val: Any) -> bool:
+    """
+    Parse a Jira checkbox field.
+    Checkbox fields can be: None, boolean, or list with {"value": "Yes"/"No"}
+    """
+    parser = _CHECKBOX_PARSERS.get(type(val))
+    if parser is None:
+        return str(val).lower() in ("yes", "true", "1")
+    return parser(val)
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings drawn from a small vocabulary (people, affiliations, statuses)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class IssueInfo(NamedTuple):
+    """Processed issue information (link_* are only set on linked issues)."""
+
+    key: str
+    summary: str
+    url: str
+    chair: Optional[str]
+    chair_email: Optional[str]
+    chair_affiliation: Optional[str]
+    vice_chair: Optional[str]
+    vice_chair_email: Optional[str]
+    vice_chair_affiliation: Optional[str]
+    emails: List[str]
+    status: Optional[str]
+    charter: Optional[str]
+    confluence_space: Optional[str]
+    mailing_list: Optional[str]
+    activity_level: Optional[str]
+    meeting_notes: Optional[str]
+    creation_date: Optional[str]
+    next_election_month: Optional[str]
+    next_election_year: Optional[str]
+    last_election_month: Optional[str]
+    last_election_year: Optional[str]
+    is_acting_chair: bool
+    is_acting_vice_chair: bool
+    recharter_approval_date: Optional[str]
+    participation_voting: Optional[str]
+    link_type: Optional[str] = None
+    link_direction: Optional[str] = None
+
+
+def process_issue(issue_data: Dict) -> IssueInfo:
     """
     Process a single issue and extract required fields.
-    Returns a structured dict with issue information.
+    Returns an IssueInfo with issue information.
     """
     fields = issue_data.get("fields", {})
     issue_key = issue_data.get("key", "")
@@ -338,7 +764,7 @@ def process_issue(issue_data: Dict) -> Dict:
 
     # Extract chair email (separate field, can be string)
     chair_email_raw = fields.get(CF_CHAIR_EMAIL)
-    chair_email = chair_email_raw if isinstance(chair_email_raw, str) else chair_info.get("emailAddress")
+    chair_email = _intern(chair_email_raw if isinstance(chair_email_raw, str) else chair_info.get("emailAddress"))
 
     # Extract vice-chair info (can be user object or string)
     vice_chair_raw = fields.get(CF_VICE_CHAIR)
@@ -346,7 +772,7 @@ def process_issue(issue_data: Dict) -> Dict:
 
     # Extract vice-chair email (separate field, can be string)
     vice_chair_email_raw = fields.get(CF_VICE_CHAIR_EMAIL)
-    vice_chair_email = vice_chair_email_raw if isinstance(vice_chair_email_raw, str) else vice_chair_info.get("emailAddress")
+    vice_chair_email = _intern(vice_chair_email_raw if isinstance(vice_chair_email_raw, str) else vice_chair_info.get("emailAddress"))
 
     # Collect all emails
     emails = []
@@ -357,7 +783,7 @@ def process_issue(issue_data: Dict) -> Dict:
 
     # Extract status
     status_raw = fields.get("status")
-    status = status_raw.get("name") if isinstance(status_raw, dict) else None
+    status = _intern(status_raw.get("name")) if isinstance(status_raw, dict) else None
 
     # Extract affiliations
     chair_affiliation = fields.get(CF_CHAIR_AFFILIATION)
@@ -366,12 +792,14 @@ def process_issue(issue_data: Dict) -> Dict:
     vice_chair_affiliation = fields.get(CF_VICE_CHAIR_AFFILIATION)
     if isinstance(vice_chair_affiliation, dict):
         vice_chair_affiliation = vice_chair_affiliation.get("value") or vice_chair_affiliation.get("name")
+    chair_affiliation = _intern(chair_affiliation)
+    vice_chair_affiliation = _intern(vice_chair_affiliation)
 
     # Extract additional fields
     charter = extract_url_field(fields.get(CF_CHARTER))
     confluence_space = extract_url_field(fields.get(CF_CONFLUENCE_SPACE))
     mailing_list = extract_url_field(fields.get(CF_MAILING_LIST))
-    activity_level = extract_dropdown_value(fields.get(CF_ACTIVITY_LEVEL))
+    activity_level = _intern(extract_dropdown_value(fields.get(CF_ACTIVITY_LEVEL)))
     meeting_notes = extract_url_field(fields.get(CF_MEETING_NOTES))
     creation_date = fields.get(CF_GROUP_CREATION_DATE)  # Date string like "2023-01-15"
     next_election_month = extract_dropdown_value(fields.get(CF_NEXT_ELECTION_MONTH))
@@ -382,21 +810,6 @@ def process_issue(issue_data: Dict) -> Dict:
     # Extract acting chair/vice-chair flags (checkbox fields)
     is_acting_chair_raw = fields.get(CF_IS_ACTING_CHAIR)
     is_acting_vice_chair_raw = fields.get(CF_IS_ACTING_VICE_CHAIR)
-    # Checkbox fields can be: None, boolean, or list with {"value": "Yes"/"No"}
-    def parse_checkbox(val):
-        if val is None:
-            return False
-        if isinstance(val, bool):
-            return val
-        if isinstance(val, list) and len(val) > 0:
-            first = val[0]
-            if isinstance(first, dict):
-                return first.get("value", "").lower() == "yes"
-            return str(first).lower() == "yes"
-        if isinstance(val, dict):
-            return val.get("value", "").lower() == "yes"
-        return str(val).lower() in ("yes", "true", "1")
-
     is_acting_chair = parse_checkbox(is_acting_chair_raw)
     is_acting_vice_chair = parse_checkbox(is_acting_vice_chair_raw)
 
@@ -406,41 +819,42 @@ def process_issue(issue_data: Dict) -> Dict:
     # Extract participation & voting rights
     participation_voting = extract_url_field(fields.get(CF_PARTICIPATION_VOTING))
 
-    return {
-        "key": issue_key,
-        "summary": fields.get("summary", ""),
-        "url": get_issue_url(issue_key),
-        "chair": chair_info.get("displayName"),
-        "chair_email": chair_email,
-        "chair_affiliation": chair_affiliation,
-        "vice_chair": vice_chair_info.get("displayName"),
-        "vice_chair_email": vice_chair_email,
-        "vice_chair_affiliation": vice_chair_affiliation,
-        "emails": emails,
-        "status": status,
-        "charter": charter,
-        "confluence_space": confluence_space,
-        "mailing_list": mailing_list,
-        "activity_level": activity_level,
-        "meeting_notes": meeting_notes,
-        "creation_date": creation_date,
-        "next_election_month": next_election_month,
-        "next_election_year": next_election_year,
-        "last_election_month": last_election_month,
-        "last_election_year": last_election_year,
-        "is_acting_chair": is_acting_chair,
-        "is_acting_vice_chair": is_acting_vice_chair,
-        "recharter_approval_date": recharter_approval_date,
-        "participation_voting": participation_voting,
-    }
+    return IssueInfo(
+        key=issue_key,
+        summary=fields.get("summary", ""),
+        url=get_issue_url(issue_key),
+        chair=_intern(chair_info.get("displayName")),
+        chair_email=chair_email,
+        chair_affiliation=chair_affiliation,
+        vice_chair=_intern(vice_chair_info.get("displayName")),
+        vice_chair_email=vice_chair_email,
+        vice_chair_affiliation=vice_chair_affiliation,
+        emails=emails,
+        status=status,
+        charter=charter,
+        confluence_space=confluence_space,
+        mailing_list=mailing_list,
+        activity_level=activity_level,
+        meeting_notes=meeting_notes,
+        creation_date=creation_date,
+        next_election_month=next_election_month,
+        next_election_year=next_election_year,
+        last_election_month=last_election_month,
+        last_election_year=last_election_year,
+        is_acting_chair=is_acting_chair,
+        is_acting_vice_chair=is_acting_vice_chair,
+        recharter_approval_date=recharter_approval_date,
+        participation_voting=participation_voting,
+    )
 
 
 def get_linked_issues(
     issue_data: Dict,
-    link_types: List[str],
+    link_types_lc: Tuple[str, ...],
 ) -> List[Dict]:
     """
-    Extract linked issues from issue data based on specified link types.
+    Extract linked issues from issue data based on specified link types
+    (already lower-cased, e.g. LINK_TYPES_OF_INTEREST_LC).
     Returns list of linked issue references.
     """
     fields = issue_data.get("fields", {})
@@ -458,8 +872,7 @@ def get_linked_issues(
         link_direction = None
 
         # Check if this link type matches our criteria
-        for lt in link_types:
-            lt_lower = lt.lower()
+        for lt_lower in link_types_lc:
             if lt_lower in inward_name and "inwardIssue" in link:
                 linked_issue = link.get("inwardIssue")
                 link_direction = "inward"
@@ -484,182 +897,326 @@ def fetch_and_process_issues(
     jql: Optional[str],
     issue_keys: Optional[List[str]],
     verbose: bool = False,
-) -> List[Dict]:
+    page_size: int = SEARCH_PAGE_SIZE,
+    disk_cache: Optional[Dict[str, Dict]] = None,
+    linked_fields: Sequence[str] = LINKED_ISSUE_FIELDS,
+) -> Iterator[Dict]:
     """
-    Fetch issues and their linked issues, process and return structured data.
+    Fetch issues and their linked issues, process and yield structured data,
+    one result per parent issue.
+    Issues fetched by key are looked up in, and added to, disk_cache if given.
+    Linked issues are fetched with linked_fields; fields left out of it are
+    reported as empty.
+
+    Parents come with their issuelinks inline, so the number of requests
+    grows with pages rather than with issues x links: one search per
+    page_size parents (or per JQL_KEYS_PER_SEARCH --issues keys), one
+    bulkfetch per BULK_FETCH_MAX_KEYS distinct linked issues, and single
+    GETs only for keys those calls did not return.
     """
-    results = []
+    # Raw issue data by key for this run, so an issue is requested at most once
+    issue_cache: Dict[str, Optional[Dict]] = {}
+
+    # Phase 1: process parent issues and collect their linked issue references.
+    # Processed parents are also reused when another parent links to them
+    # (they were fetched with ISSUE_FIELDS, a superset of linked_fields).
+    parents: List[Tuple[IssueInfo, List[Dict]]] = []
+    linked_by_key: Dict[str, IssueInfo] = {}
+
+    def add_parent(issue_data: Dict, progress: str) -> None:
+        print(f"Processing {progress}: {issue_data.get('key', '')}")
+
+        # Process main issue
+        main_info = process_issue(issue_data)
+        linked_by_key[main_info.key] = main_info
+
+        # Get linked issues
+        linked_refs = get_linked_issues(issue_data, LINK_TYPES_OF_INTEREST_LC)
+        parents.append((main_info, linked_refs))
+
+    def get_issue_details_cached(key: str, fields: Sequence[str]) -> Optional[Dict]:
+        if key in issue_cache:
+            return issue_cache[key]
+        data = get_cached_issue(disk_cache, key, fields)
+        if data is None:
+            data = get_issue_details(sess, key, fields, verbose)
+            if data:
+                put_cached_issue(disk_cache, key, fields, data)
+        issue_cache[key] = data
+        return data
+
+    def fetch_missing_concurrently(keys: List[str], fields: Sequence[str]) -> None:
+        # Single GETs for keys not fetched yet, run on the shared session
+        missing = [key for key in dict.fromkeys(keys) if key not in issue_cache]
+        if not missing:
+            return
+        with ThreadPoolExecutor(max_workers=LINKED_FETCH_WORKERS) as executor:
+            list(executor.map(lambda key: get_issue_details_cached(key, fields), missing))
 
     if issue_keys:
-        # Fetch specific issues
+        # Fetch specific issues with bulk JQL searches; any key the search
+        # did not return (e.g. a nonexistent key failing the whole batch) is
+        # retried individually so it gets its own warning
         print(f"Fetching {len(issue_keys)} specified issue(s)...")
+        uncached_keys = [
+            key for key in issue_keys
+            if get_cached_issue(disk_cache, key.upper(), ISSUE_FIELDS) is None
+        ]
+        if uncached_keys:
+            found = search_issues_by_keys(sess, uncached_keys, ISSUE_FIELDS, verbose, page_size)
+            for key, issue in found.items():
+                put_cached_issue(disk_cache, key, ISSUE_FIELDS, issue)
+                issue_cache[key] = issue
+        fetch_missing_concurrently([key.upper() for key in issue_keys], ISSUE_FIELDS)
         issues = []
         for key in issue_keys:
-            issue = get_issue_details(sess, key, ISSUE_FIELDS, verbose)
+            issue = get_issue_details_cached(key.upper(), ISSUE_FIELDS)
             if issue:
                 issues.append(issue)
+
+        print(f"Found {len(issues)} issue(s)")
+        for idx, issue_data in enumerate(issues, 1):
+            add_parent(issue_data, f"{idx}/{len(issues)}")
     else:
-        # Search using JQL
+        # Search using JQL, processing each page as it arrives. A search is
+        # always re-run, so its raw results are not kept in disk_cache and
+        # each page can be dropped once processed
         search_jql = jql or DEFAULT_JQL
         print(f"Searching issues with JQL: {search_jql}")
-        issues = search_issues(sess, search_jql, ISSUE_FIELDS, verbose)
-
-    print(f"Found {len(issues)} issue(s)")
+        for page in iter_search_issues(sess, search_jql, ISSUE_FIELDS, verbose, page_size):
+            for issue in page:
+                add_parent(issue, str(len(parents) + 1))
+
+        print(f"Found {len(parents)} issue(s)")
+
+    # Phase 2: fetch every distinct linked issue once, in bulk requests of up to
+    # BULK_FETCH_MAX_KEYS keys sent concurrently (the session is shared, its
+    # connection pool is thread-safe)
+    unique_keys = [
+        key for key in dict.fromkeys(
+            ref.get("key") for _, linked_refs in parents for ref in linked_refs
+        )
+        if key not in linked_by_key
+    ]
+    if unique_keys:
+        print(f"Fetching {len(unique_keys)} linked issue(s)...")
+
+        uncached_keys = [
+            key for key in unique_keys
+            if key not in issue_cache
+            and get_cached_issue(disk_cache, key, linked_fields) is None
+        ]
+        chunks = [
+            uncached_keys[start:start + BULK_FETCH_MAX_KEYS]
+            for start in range(0, len(uncached_keys), BULK_FETCH_MAX_KEYS)
+        ]
 
-    # Process each issue
-    for idx, issue_data in enumerate(issues, 1):
-        issue_key = issue_data.get("key", "")
-        print(f"Processing {idx}/{len(issues)}: {issue_key}")
+        def fetch_chunk(chunk: List[str]) -> Dict[str, Dict]:
+            return bulk_fetch_issues(sess, chunk, linked_fields, verbose)
 
-        # Process main issue
-        main_info = process_issue(issue_data)
+        with ThreadPoolExecutor(max_workers=LINKED_FETCH_WORKERS) as executor:
+            for found in executor.map(fetch_chunk, chunks):
+                for key, issue in found.items():
+                    put_cached_issue(disk_cache, key, linked_fields, issue)
+                    issue_cache[key] = issue
 
-        # Get linked issues
-        linked_refs = get_linked_issues(issue_data, LINK_TYPES_OF_INTEREST)
+        # Anything the bulk fetch did not return (missing, renamed or a failed
+        # chunk) falls back to a single GET, which reports its own warning
+        fetch_missing_concurrently(unique_keys, linked_fields)
+        for linked_key in unique_keys:
+            linked_data = get_issue_details_cached(linked_key, linked_fields)
+            if linked_data:
+                linked_by_key[linked_key] = process_issue(linked_data)
 
-        # Fetch details for linked issues
+    # Phase 3: combine results
+    for main_info, linked_refs in parents:
         linked_issues = []
         for ref in linked_refs:
-            linked_key = ref.get("key")
-            if verbose:
-                print(f"  [VERBOSE] Fetching linked issue: {linked_key}")
-
-            linked_data = get_issue_details(sess, linked_key, ISSUE_FIELDS, verbose)
-            if linked_data:
-                linked_info = process_issue(linked_data)
-                linked_info["link_type"] = ref.get("link_type")
-                linked_info["link_direction"] = ref.get("direction")
-                linked_issues.append(linked_info)
-
-        # Combine results
-        result = {
+            linked_info = linked_by_key.get(ref.get("key"))
+            if linked_info:
+                linked_issues.append(linked_info._replace(
+                    link_type=ref.get("link_type"),
+                    link_direction=ref.get("direction"),
+                ))
+
+        yield {
             "issue": main_info,
             "linked_issues": linked_issues,
         }
-        results.append(result)
 
-    return results
 
+def iter_text_lines(results: Iterable[Dict]) -> Iterator[str]:
+    """Yield results formatted as organized text, one line at a time."""
+    yield "=" * 80
+    yield "RVG ISSUES WITH LINKED GOVERNANCE"
+    yield "=" * 80
+    yield ""
 
-def format_text_output(results: List[Dict]) -> str:
-    """Format results as organized text."""
-    lines = []
-    lines.append("=" * 80)
-    lines.append("RVG ISSUES WITH LINKED GOVERNANCE")
-    lines.append("=" * 80)
-    lines.append("")
-
+    count = 0
     for result in results:
+        count += 1
         issue = result["issue"]
         linked = result["linked_issues"]
 
-        lines.append("-" * 80)
-        lines.append(f"Issue: {issue['key']}")
-        lines.append("-" * 80)
-        lines.append(f"  Summary:     {issue['summary']}")
-        lines.append(f"  URL:         {issue['url']}")
-        lines.append(f"  Chair:       {issue['chair'] or 'N/A'}")
-        if issue['chair_email']:
-            lines.append(f"               Email: {issue['chair_email']}")
-        lines.append(f"  Vice-Chair:  {issue['vice_chair'] or 'N/A'}")
-        if issue['vice_chair_email']:
-            lines.append(f"               Email: {issue['vice_chair_email']}")
-        if issue['emails']:
-            lines.append(f"  Emails:      {', '.join(issue['emails'])}")
+        yield "-" * 80
+        yield f"Issue: {issue.key}"
+        yield "-" * 80
+        yield f"  Summary:     {issue.summary}"
+        yield f"  URL:         {issue.url}"
+        yield f"  Chair:       {issue.chair or 'N/A'}"
+        if issue.chair_email:
+            yield f"               Email: {issue.chair_email}"
+        yield f"  Vice-Chair:  {issue.vice_chair or 'N/A'}"
+        if issue.vice_chair_email:
+            yield f"               Email: {issue.vice_chair_email}"
+        if issue.emails:
+            yield f"  Emails:      {', '.join(issue.emails)}"
 
         if linked:
-            lines.append("")
-            lines.append(f"  Linked Issues ({len(linked)}):")
+            yield ""
+            yield f"  Linked Issues ({len(linked)}):"
             for li in linked:
-                lines.append(f"    - {li['key']} ({li.get('link_type', 'unknown')})")
-                lines.append(f"      Summary:     {li['summary']}")
-                lines.append(f"      URL:         {li['url']}")
-                lines.append(f"      Chair:       {li['chair'] or 'N/A'}")
-                if li['chair_email']:
-                    lines.append(f"                   Email: {li['chair_email']}")
-                lines.append(f"      Vice-Chair:  {li['vice_chair'] or 'N/A'}")
-                if li['vice_chair_email']:
-                    lines.append(f"                   Email: {li['vice_chair_email']}")
-                if li['emails']:
-                    lines.append(f"      Emails:      {', '.join(li['emails'])}")
+                yield f"    - {li.key} ({li.link_type})"
+                yield f"      Summary:     {li.summary}"
+                yield f"      URL:         {li.url}"
+                yield f"      Chair:       {li.chair or 'N/A'}"
+                if li.chair_email:
+                    yield f"                   Email: {li.chair_email}"
+                yield f"      Vice-Chair:  {li.vice_chair or 'N/A'}"
+                if li.vice_chair_email:
+                    yield f"                   Email: {li.vice_chair_email}"
+                if li.emails:
+                    yield f"      Emails:      {', '.join(li.emails)}"
         else:
-            lines.append("")
-            lines.append("  Linked Issues: None")
+            yield ""
+            yield "  Linked Issues: None"
+
+        yield ""
+
+    yield "=" * 80
+    yield f"Total: {count} issue(s)"
+    yield "=" * 80
+
+
+def write_text(results: Iterable[Dict], *streams: TextIO) -> None:
+    """Write the text report to each stream as the lines are produced."""
+    for line in iter_text_lines(results):
+        line += "\n"
+        for f in streams:
+            f.write(line)
+
 
-        lines.append("")
+def result_to_dict(result: Dict) -> Dict:
+    """Convert a result to plain dicts for JSON output."""
+    issue = result["issue"]._asdict()
+    del issue["link_type"], issue["link_direction"]
+    return {
+        "issue": issue,
+        "linked_issues": [li._asdict() for li in result["linked_issues"]],
+    }
+
+
+def _json_dumps_pretty(data: Any) -> bytes:
+    """Encode data as indented UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
-    lines.append("=" * 80)
-    lines.append(f"Total: {len(results)} issue(s)")
-    lines.append("=" * 80)
 
-    return "\n".join(lines)
+def _json_dumps_compact(data: Any) -> bytes:
+    """Encode data as UTF-8 JSON without whitespace, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_json(results: Iterable[Dict], f: BinaryIO, compact: bool = False) -> None:
+    """
+    Write results as a JSON array to a binary stream, encoding one result at
+    a time instead of building the whole document in memory. The array is
+    indented unless compact is set.
+    """
+    f.write(b"[")
+    if compact:
+        for i, result in enumerate(results):
+            if i:
+                f.write(b",")
+            f.write(_json_dumps_compact(result_to_dict(result)))
+        f.write(b"]")
+        return
+    wrote = False
+    for result in results:
+        f.write(b",\n  " if wrote else b"\n  ")
+        # Nest the element one level into the array; JSON strings never
+        # contain raw newlines, so this only touches the indentation
+        f.write(_json_dumps_pretty(result_to_dict(result)).replace(b"\n", b"\n  "))
+        wrote = True
+    f.write(b"\n]" if wrote else b"]")
 
 
-def save_json(results: List[Dict], filepath: str) -> None:
+def save_json(results: Iterable[Dict], filepath: str) -> None:
     """Save results to JSON file."""
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    with open(filepath, "wb") as f:
+        write_json(results, f)
     print(f"Saved JSON to: {filepath}")
 
 
-def save_csv(results: List[Dict], filepath: str) -> None:
-    """Save results to CSV file (flattened format)."""
-    # Flatten results for CSV
-    rows = []
+def _iter_csv_rows(results: Iterable[Dict]) -> Iterator[Tuple]:
+    """Yield flattened CSV rows (see CSV_FIELDNAMES) for each result."""
     for result in results:
         issue = result["issue"]
         linked = result["linked_issues"]
 
         # Main issue row
-        row = {
-            "type": "main",
-            "key": issue["key"],
-            "summary": issue["summary"],
-            "url": issue["url"],
-            "chair": issue["chair"] or "",
-            "chair_email": issue["chair_email"] or "",
-            "vice_chair": issue["vice_chair"] or "",
-            "vice_chair_email": issue["vice_chair_email"] or "",
-            "emails": ";".join(issue["emails"]),
-            "linked_to": "",
-            "link_type": "",
-        }
-        rows.append(row)
+        yield (
+            "main",
+            issue.key,
+            issue.summary,
+            issue.url,
+            issue.chair or "",
+            issue.chair_email or "",
+            issue.vice_chair or "",
+            issue.vice_chair_email or "",
+            ";".join(issue.emails),
+            "",
+            "",
+        )
 
         # Linked issue rows
         for li in linked:
-            row = {
-                "type": "linked",
-                "key": li["key"],
-                "summary": li["summary"],
-                "url": li["url"],
-                "chair": li["chair"] or "",
-                "chair_email": li["chair_email"] or "",
-                "vice_chair": li["vice_chair"] or "",
-                "vice_chair_email": li["vice_chair_email"] or "",
-                "emails": ";".join(li["emails"]),
-                "linked_to": issue["key"],
-                "link_type": li.get("link_type", ""),
-            }
-            rows.append(row)
+            yield (
+                "linked",
+                li.key,
+                li.summary,
+                li.url,
+                li.chair or "",
+                li.chair_email or "",
+                li.vice_chair or "",
+                li.vice_chair_email or "",
+                ";".join(li.emails),
+                issue.key,
+                li.link_type,
+            )
 
-    # Write CSV
-    if rows:
-        fieldnames = list(rows[0].keys())
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-        print(f"Saved CSV to: {filepath}")
-    else:
-        print("No data to save to CSV")
+
+def write_csv(results: Iterable[Dict], f: TextIO) -> None:
+    """Write results to an open CSV file (flattened format), streaming rows."""
+    import csv
+
+    writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+    writer.writerow(CSV_FIELDNAMES)
+    writer.writerows(_iter_csv_rows(results))
 
 
-def save_grouped_csv(results: List[Dict], filepath: str) -> None:
+def write_grouped_csv(results: Iterable[Dict], f: TextIO) -> None:
     """
-    Save results to CSV file grouped by linked issue summary.
+    Write results to an open CSV file grouped by linked issue summary.
     """
-    rows = []
+    import csv
+
+    # Rows bucketed by linked issue summary in a single pass; rows without a
+    # linked issue go in the "" bucket
+    buckets: Dict[str, List[Dict]] = defaultdict(list)
     for result in results:
         issue = result["issue"]
         linked = result["linked_issues"]
@@ -668,66 +1225,66 @@ def save_grouped_csv(results: List[Dict], filepath: str) -> None:
             # One row per linked issue
             for li in linked:
                 row = {
-                    "Issue": issue["key"],
-                    "Summary": issue["summary"],
-                    "Status": issue.get("status") or "",
-                    "Creation Date": issue.get("creation_date") or "",
-                    "Recharter Approval Date": issue.get("recharter_approval_date") or "",
-                    "Charter": issue.get("charter") or "",
-                    "Confluence Space": issue.get("confluence_space") or "",
-                    "Mailing List": issue.get("mailing_list") or "",
-                    "Activity Level": issue.get("activity_level") or "",
-                    "Meeting Notes": issue.get("meeting_notes") or "",
-                    "Participation & Voting Rights": issue.get("participation_voting") or "",
-                    "Next Election Month": issue.get("next_election_month") or "",
-                    "Next Election Year": issue.get("next_election_year") or "",
-                    "Last Election Month": issue.get("last_election_month") or "",
-                    "Last Election Year": issue.get("last_election_year") or "",
-                    "Chair": issue["chair"] or "",
-                    "Chair Email": issue["chair_email"] or "",
-                    "Chair Affiliation": issue.get("chair_affiliation") or "",
-                    "Is Acting Chair": "Yes" if issue.get("is_acting_chair") else "No",
-                    "Vice-Chair": issue["vice_chair"] or "",
-                    "Vice-Chair Email": issue["vice_chair_email"] or "",
-                    "Vice-Chair Affiliation": issue.get("vice_chair_affiliation") or "",
-                    "Is Acting Vice-Chair": "Yes" if issue.get("is_acting_vice_chair") else "No",
-                    "Linked Issue Summary": li["summary"],
-                    "Linked Issue Chair": li["chair"] or "",
-                    "Linked Issue Chair Email": li["chair_email"] or "",
-                    "Linked Issue Chair Affiliation": li.get("chair_affiliation") or "",
-                    "Linked Issue Vice-Chair": li["vice_chair"] or "",
-                    "Linked Issue Vice-Chair Email": li["vice_chair_email"] or "",
-                    "Linked Issue Vice-Chair Affiliation": li.get("vice_chair_affiliation") or "",
-                    "Linked Issue Mailing List": li.get("mailing_list") or "",
-                    "Linked Issue Participation & Voting Rights": li.get("participation_voting") or "",
+                    "Issue": issue.key,
+                    "Summary": issue.summary,
+                    "Status": issue.status or "",
+                    "Creation Date": issue.creation_date or "",
+                    "Recharter Approval Date": issue.recharter_approval_date or "",
+                    "Charter": issue.charter or "",
+                    "Confluence Space": issue.confluence_space or "",
+                    "Mailing List": issue.mailing_list or "",
+                    "Activity Level": issue.activity_level or "",
+                    "Meeting Notes": issue.meeting_notes or "",
+                    "Participation & Voting Rights": issue.participation_voting or "",
+                    "Next Election Month": issue.next_election_month or "",
+                    "Next Election Year": issue.next_election_year or "",
+                    "Last Election Month": issue.last_election_month or "",
+                    "Last Election Year": issue.last_election_year or "",
+                    "Chair": issue.chair or "",
+                    "Chair Email": issue.chair_email or "",
+                    "Chair Affiliation": issue.chair_affiliation or "",
+                    "Is Acting Chair": "Yes" if issue.is_acting_chair else "No",
+                    "Vice-Chair": issue.vice_chair or "",
+                    "Vice-Chair Email": issue.vice_chair_email or "",
+                    "Vice-Chair Affiliation": issue.vice_chair_affiliation or "",
+                    "Is Acting Vice-Chair": "Yes" if issue.is_acting_vice_chair else "No",
+                    "Linked Issue Summary": li.summary,
+                    "Linked Issue Chair": li.chair or "",
+                    "Linked Issue Chair Email": li.chair_email or "",
+                    "Linked Issue Chair Affiliation": li.chair_affiliation or "",
+                    "Linked Issue Vice-Chair": li.vice_chair or "",
+                    "Linked Issue Vice-Chair Email": li.vice_chair_email or "",
+                    "Linked Issue Vice-Chair Affiliation": li.vice_chair_affiliation or "",
+                    "Linked Issue Mailing List": li.mailing_list or "",
+                    "Linked Issue Participation & Voting Rights": li.participation_voting or "",
                 }
-                rows.append(row)
+                buckets[li.summary or ""].append(row)
         else:
             # Issue with no linked issues
             row = {
-                "Issue": issue["key"],
-                "Summary": issue["summary"],
-                "Status": issue.get("status") or "",
-                "Creation Date": issue.get("creation_date") or "",
-                "Recharter Approval Date": issue.get("recharter_approval_date") or "",
-                "Charter": issue.get("charter") or "",
-                "Confluence Space": issue.get("confluence_space") or "",
-                "Mailing List": issue.get("mailing_list") or "",
-                "Activity Level": issue.get("activity_level") or "",
-                "Meeting Notes": issue.get("meeting_notes") or "",
-                "Participation & Voting Rights": issue.get("participation_voting") or "",
-                "Next Election Month": issue.get("next_election_month") or "",
-                "Next Election Year": issue.get("next_election_year") or "",
-                "Last Election Month": issue.get("last_election_month") or "",
-                "Last Election Year": issue.get("last_election_year") or "",
-                "Chair": issue["chair"] or "",
-                "Chair Email": issue["chair_email"] or "",
-                "Chair Affiliation": issue.get("chair_affiliation") or "",
-                "Is Acting Chair": "Yes" if issue.get("is_acting_chair") else "No",
-                "Vice-Chair": issue["vice_chair"] or "",
-                "Vice-Chair Email": issue["vice_chair_email"] or "",
-                "Vice-Chair Affiliation": issue.get("vice_chair_affiliation") or "",
-                "Is Acting Vice-Chair": "Yes" if issue.get("is_acting_vice_chair") else "No",
+                "Issue": issue.key,
+                "Summary": issue.summary,
+                "Status": issue.status or "",
+                "Creation Date": issue.creation_date or "",
+                "Recharter Approval Date": issue.recharter_approval_date or "",
+                "Charter": issue.charter or "",
+                "Confluence Space": issue.confluence_space or "",
+                "Mailing List": issue.mailing_list or "",
+                "Activity Level": issue.activity_level or "",
+                "Meeting Notes": issue.meeting_notes or "",
+                "Participation & Voting Rights": issue.participation_voting or "",
+                "Next Election Month": issue.next_election_month or "",
+                "Next Election Year": issue.next_election_year or "",
+                "Last Election Month": issue.last_election_month or "",
+                "Last Election Year": issue.last_election_year or "",
+                "Chair": issue.chair or "",
+                "Chair Email": issue.chair_email or "",
+                "Chair Affiliation": issue.chair_affiliation or "",
+                "Is Acting Chair": "Yes" if issue.is_acting_chair else "No",
+                "Vice-Chair": issue.vice_chair or "",
+                "Vice-Chair Email": issue.vice_chair_email or "",
+                "Vice-Chair Affiliation": issue.vice_chair_affiliation or "",
+                "Is Acting Vice-Chair": "Yes" if issue.is_acting_vice_chair else "No",
                 "Linked Issue Summary": "",
                 "Linked Issue Chair": "",
                 "Linked Issue Chair Email": "",
@@ -738,54 +1295,55 @@ def save_grouped_csv(results: List[Dict], filepath: str) -> None:
                 "Linked Issue Mailing List": "",
                 "Linked Issue Participation & Voting Rights": "",
             }
-            rows.append(row)
+            buckets[""].append(row)
 
-    # Sort by Linked Issue Summary to group them together
-    rows.sort(key=lambda x: (x["Linked Issue Summary"] or "zzz", x["Issue"]))
+    # Groups in linked issue summary order, rows without a linked issue last;
+    # each group sorted by issue key
+    unlinked_rows = buckets.pop("", [])
+    groups = [buckets[summary] for summary in sorted(buckets)]
+    groups.append(unlinked_rows)
+    by_issue = itemgetter("Issue")
 
     # Write CSV
-    if rows:
-        fieldnames = [
-            "Issue",
-            "Summary",
-            "Status",
-            "Creation Date",
-            "Recharter Approval Date",
-            "Charter",
-            "Confluence Space",
-            "Mailing List",
-            "Activity Level",
-            "Meeting Notes",
-            "Participation & Voting Rights",
-            "Next Election Month",
-            "Next Election Year",
-            "Last Election Month",
-            "Last Election Year",
-            "Chair",
-            "Chair Email",
-            "Chair Affiliation",
-            "Is Acting Chair",
-            "Vice-Chair",
-            "Vice-Chair Email",
-            "Vice-Chair Affiliation",
-            "Is Acting Vice-Chair",
-            "Linked Issue Summary",
-            "Linked Issue Chair",
-            "Linked Issue Chair Email",
-            "Linked Issue Chair Affiliation",
-            "Linked Issue Vice-Chair",
-            "Linked Issue Vice-Chair Email",
-            "Linked Issue Vice-Chair Affiliation",
-            "Linked Issue Mailing List",
-            "Linked Issue Participation & Voting Rights",
-        ]
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-        print(f"Saved grouped CSV to: {filepath}")
-    else:
-        print("No data to save to CSV")
+    fieldnames = [
+        "Issue",
+        "Summary",
+        "Status",
+        "Creation Date",
+        "Recharter Approval Date",
+        "Charter",
+        "Confluence Space",
+        "Mailing List",
+        "Activity Level",
+        "Meeting Notes",
+        "Participation & Voting Rights",
+        "Next Election Month",
+        "Next Election Year",
+        "Last Election Month",
+        "Last Election Year",
+        "Chair",
+        "Chair Email",
+        "Chair Affiliation",
+        "Is Acting Chair",
+        "Vice-Chair",
+        "Vice-Chair Email",
+        "Vice-Chair Affiliation",
+        "Is Acting Vice-Chair",
+        "Linked Issue Summary",
+        "Linked Issue Chair",
+        "Linked Issue Chair Email",
+        "Linked Issue Chair Affiliation",
+        "Linked Issue Vice-Chair",
+        "Linked Issue Vice-Chair Email",
+        "Linked Issue Vice-Chair Affiliation",
+        "Linked Issue Mailing List",
+        "Linked Issue Participation & Voting Rights",
+    ]
+    writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+    writer.writerow(fieldnames)
+    for group in groups:
+        group.sort(key=by_issue)
+        writer.writerows(tuple(row[k] for k in fieldnames) for row in group)
 
 
 # =========================
@@ -793,7 +1351,19 @@ def save_grouped_csv(results: List[Dict], filepath: str) -> None:
 # =========================
 
 
-def main() -> None:
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse and validate command-line arguments (argv defaults to sys.argv)."""
     parser = argparse.ArgumentParser(
         description="Fetch RVG issues with linked governance information.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -804,12 +1374,17 @@ Examples:
     %(prog)s --output csv --save output.csv
     %(prog)s --jql "project = RVG AND status = Active"
     %(prog)s --issues RVG-1 RVG-2 RVG-3
+    %(prog)s --batch-size 50
+    %(prog)s --no-cache
     %(prog)s --verbose
 
 Environment variables:
     JIRA_USER_EMAIL  - Your Jira account email (required)
     JIRA_API_TOKEN   - Your Jira API token (required)
     JIRA_SERVER_URL  - Jira server URL (default: https://riscv.atlassian.net)
+    JIRA_MAX_WORKERS - Concurrent linked-issue requests (default: 10)
+    JIRA_BATCH_SIZE  - Issues requested per search page (default: 100)
+    JIRA_MAX_RPS     - Maximum requests per second, 0 for no limit (default: 10)
 """,
     )
     parser.add_argument(
@@ -834,6 +1409,30 @@ Environment variables:
         metavar="FILE",
         help="Save output to file (for json/csv formats).",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=SEARCH_PAGE_SIZE,
+        metavar="N",
+        help=f"Issues requested per search page (default: {SEARCH_PAGE_SIZE}).",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_CACHE_TTL_SECS,
+        metavar="SECS",
+        help=f"Reuse issues cached by earlier runs for this long (default: {DEFAULT_CACHE_TTL_SECS}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk caches.",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Delete the on-disk caches before fetching.",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -845,7 +1444,21 @@ Environment variables:
         action="store_true",
         help="Fetch and list all available link types in Jira, then exit.",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    # Validate output options before doing any work, so a missing --save does
+    # not only show up after the whole fetch
+    if not args.list_link_types and not args.save:
+        if args.output == "csv":
+            parser.error("CSV output requires --save option to specify output file.")
+        if args.output == "grouped-csv":
+            parser.error("Grouped CSV output requires --save option to specify output file.")
+
+    return args
+
+
+def main() -> None:
+    args = parse_args()
 
     # Validate environment variables
     if not JIRA_USER_EMAIL or not JIRA_API_TOKEN:
@@ -856,67 +1469,80 @@ Environment variables:
         print(f"[VERBOSE] Jira Server: {JIRA_SERVER_URL}")
         print(f"[VERBOSE] User: {JIRA_USER_EMAIL}")
 
-    sess = make_http_session()
-
-    # List link types option
-    if args.list_link_types:
-        print("Fetching available link types...")
-        auth = HTTPBasicAuth(JIRA_USER_EMAIL, JIRA_API_TOKEN)
-        url = f"{JIRA_SERVER_URL}/rest/api/3/issueLinkType"
-        resp = sess.get(url, auth=auth, timeout=HTTP_TIMEOUT_SECS)
-        if resp.status_code == 200:
-            data = resp.json()
-            print("\nAvailable Link Types:")
-            print("-" * 60)
-            for lt in data.get("issueLinkTypes", []):
-                print(f"  Name: {lt.get('name')}")
-                print(f"    Inward:  {lt.get('inward')}")
-                print(f"    Outward: {lt.get('outward')}")
-                print()
-        else:
-            print(f"Error fetching link types: HTTP {resp.status_code}")
-        return
-
-    # Fetch and process issues
-    results = fetch_and_process_issues(
-        sess=sess,
-        jql=args.jql,
-        issue_keys=args.issues,
-        verbose=args.verbose,
-    )
-
-    if not results:
-        print("No issues found.")
-        return
-
-    # Output results
-    if args.output == "text":
-        output = format_text_output(results)
-        print(output)
-        if args.save:
-            with open(args.save, "w", encoding="utf-8") as f:
-                f.write(output)
-            print(f"Saved text to: {args.save}")
-
-    elif args.output == "json":
-        if args.save:
-            save_json(results, args.save)
-        else:
-            print(json.dumps(results, indent=2, ensure_ascii=False))
-
-    elif args.output == "csv":
-        if args.save:
-            save_csv(results, args.save)
-        else:
-            print("CSV output requires --save option to specify output file.")
-            sys.exit(1)
-
-    elif args.output == "grouped-csv":
-        if args.save:
-            save_grouped_csv(results, args.save)
-        else:
-            print("Grouped CSV output requires --save option to specify output file.")
-            sys.exit(1)
+    with make_http_session() as sess:
+        if args.clear_cache:
+            clear_cache()
+
+        # List link types option
+        if args.list_link_types:
+            print("Fetching available link types...")
+            data = get_link_types(sess, use_cache=not args.no_cache, verbose=args.verbose)
+            if data is not None:
+                print("\nAvailable Link Types:")
+                print("-" * 60)
+                for lt in data.get("issueLinkTypes", []):
+                    print(f"  Name: {lt.get('name')}")
+                    print(f"    Inward:  {lt.get('inward')}")
+                    print(f"    Outward: {lt.get('outward')}")
+                    print()
+            return
+
+        disk_cache = None if args.no_cache else load_issue_cache(args.cache_ttl)
+
+        # Fetch and process issues (results are produced lazily and written out
+        # one at a time by the output formats below)
+        results = fetch_and_process_issues(
+            sess=sess,
+            jql=args.jql,
+            issue_keys=args.issues,
+            verbose=args.verbose,
+            page_size=args.batch_size,
+            disk_cache=disk_cache,
+            linked_fields=ISSUE_FIELDS if args.output == "json" else LINKED_ISSUE_FIELDS,
+        )
+
+        # Save the cache only after the results generator has been drained by
+        # the output (or the run failed), whenever its fetching happens
+        try:
+            first = next(results, None)
+            if first is None:
+                print("No issues found.")
+                return
+            results = itertools.chain([first], results)
+
+            # Output results
+            if args.output == "text":
+                if args.save:
+                    with open(args.save, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+                        write_text(results, sys.stdout, f)
+                    print(f"Saved text to: {args.save}")
+                else:
+                    write_text(results, sys.stdout)
+
+            elif args.output == "json":
+                if args.save:
+                    save_json(results, args.save)
+                else:
+                    # Encoded bytes go straight to the binary stdout buffer;
+                    # compact when piped to another tool, indented for a terminal
+                    sys.stdout.flush()
+                    write_json(results, sys.stdout.buffer, compact=not sys.stdout.isatty())
+                    sys.stdout.buffer.write(b"\n")
+                    sys.stdout.buffer.flush()
+
+            elif args.output == "csv":
+                with open(args.save, "w", newline="", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+                    write_csv(results, f)
+                print(f"Saved CSV to: {args.save}")
+
+            elif args.output == "grouped-csv":
+                with open(args.save, "w", newline="", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+                    write_grouped_csv(results, f)
+                print(f"Saved grouped CSV to: {args.save}")
+
+        finally:
+            if disk_cache is not None:
+                save_issue_cache(disk_cache)
 
 
 if __name__ == "__main__":